@@ -97,7 +97,7 @@ def parse_chatgpt(data: Any) -> List[dict]:
                         role = msg.get("author", {}).get("role", "assistant")
                         if role in {"user", "assistant"}:
                             ts_val = msg.get("create_time") or msg.get("timestamp") or ts
-                            text = sanitize_text(_parts_to_text(parts))
+                            text = _parts_to_text(parts)
                             if text:
                                 stack.append((role, text, parse_timestamp(ts_val, ts)))
                     parent_id = node.get("parent")
@@ -127,7 +127,7 @@ def parse_chatgpt(data: Any) -> List[dict]:
                             role = msg.get("author", {}).get("role", "assistant")
                             if role in {"user", "assistant"}:
                                 ts_val = msg.get("create_time") or msg.get("timestamp") or ts
-                                text = sanitize_text(_parts_to_text(parts))
+                                text = _parts_to_text(parts)
                                 if text:
                                     messages.append((role, text, parse_timestamp(ts_val, ts)))
                         next_ids = node.get("children") or []
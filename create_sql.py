@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Generate SQL insert statements from open-webui chat JSON files."""
 import argparse
+import itertools
 import json
 import os
+import sys
 import uuid
+from typing import Iterable, Iterator, TextIO
 
 
 def load_json(path: str) -> dict:
@@ -54,7 +57,7 @@ def tag_upserts(user_id: str, meta_tags: list[str]) -> list[str]:
         )
     return stmts
 
-def json_to_sql(path: str, tags: list[str]) -> tuple[str, str]:
+def json_to_sql(path: str, meta: str) -> tuple[str, str]:
     data = load_json(path)
     chat_json = json.dumps(data, ensure_ascii=True)
     chat_json = escape_sql_string(chat_json)
@@ -74,8 +77,6 @@ def json_to_sql(path: str, tags: list[str]) -> tuple[str, str]:
     except ValueError:
         record_id = str(uuid.uuid4())
 
-    meta = build_meta(tags)
-
     sql = (
         f'DELETE FROM "main"."chat" WHERE "id" = "{record_id}";\n'
         'INSERT INTO "main"."chat" ("id","user_id","title","share_id","archived","created_at","updated_at","chat","pinned","meta","folder_id")\n'
@@ -84,18 +85,33 @@ def json_to_sql(path: str, tags: list[str]) -> tuple[str, str]:
     return sql, user_id
 
 
+def _scan_json(directory: str) -> Iterator[str]:
+    """Yield paths of ``.json`` files under ``directory``, recursively."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_json(entry.path)
+            elif entry.name.endswith('.json') and entry.is_file():
+                yield entry.path
+
+
 def gather_files(paths: list[str]) -> list[str]:
     result = []
     for p in paths:
         if os.path.isdir(p):
-            for name in os.listdir(p):
-                if name.endswith('.json'):
-                    result.append(os.path.join(p, name))
+            result.extend(_scan_json(p))
         else:
             result.append(p)
     return result
 
 
+def write_statements(statements: Iterable[str], fh: TextIO) -> None:
+    """Write each SQL statement to ``fh`` followed by a newline."""
+    for stmt in statements:
+        fh.write(stmt)
+        fh.write("\n")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Create SQL inserts for open-webui chats")
     parser.add_argument("files", nargs="+", help="Chat JSON files or directories")
@@ -105,12 +121,13 @@ def main() -> None:
 
     tags = [t.strip() for t in args.tags.split(',') if t.strip()] or ["imported"]
 
+    meta = build_meta(tags)
     files = gather_files(args.files)
     inserts = []
     user_ids: set[str] = set()
     for fpath in files:
         try:
-            sql, uid = json_to_sql(fpath, tags)
+            sql, uid = json_to_sql(fpath, meta)
             inserts.append(sql)
             user_ids.add(uid)
         except Exception as exc:
@@ -120,12 +137,12 @@ def main() -> None:
     for uid in sorted(user_ids):
         prefix.extend(tag_upserts(uid, tags))
 
-    output = "\n".join(prefix + inserts)
+    statements = itertools.chain(prefix, inserts)
     if args.output:
         with open(args.output, "w", encoding="utf-8") as f:
-            f.write(output + "\n")
+            write_statements(statements, f)
     else:
-        print(output)
+        write_statements(statements, sys.stdout)
 
 
 if __name__ == "__main__":
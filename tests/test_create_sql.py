@@ -0,0 +1,25 @@
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import create_sql
+
+
+def test_gather_files_recurses_into_subdirectories(tmp_path):
+    (tmp_path / "grok").mkdir()
+    (tmp_path / "grok" / "a.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "b.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    (tmp_path / "dir.json").mkdir()
+    single = tmp_path / "notes.txt"
+
+    result = create_sql.gather_files([str(tmp_path), str(single)])
+
+    assert sorted(result[:-1]) == sorted([
+        os.path.join(str(tmp_path), "grok", "a.json"),
+        os.path.join(str(tmp_path), "b.json"),
+    ])
+    assert result[-1] == str(single)